@@ -1,7 +1,10 @@
+# Solo modulos de la libreria estandar: Proyecto y Reporte se importan despues de
+# analizar los argumentos para que --help y --version respondan sin cargarlos.
 import os
 import argparse
-from Proyecto import DataGenerator, ConfigLoader
-from Reporte import ReportGenerator
+
+# Debe coincidir con la version declarada en pyproject.toml ([tool.poetry] version)
+__version__ = "0.1.0"
 
 
 def main():
@@ -12,6 +15,7 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Ejecutar Proyecto.py o Reporte.py en el contexto de Apolo_11.")
     parser.add_argument("script", choices=["proyecto", "reporte"], help="Selecciona 'proyecto' o 'reporte'.")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     args = parser.parse_args()
 
     base_path = os.path.dirname(os.path.abspath(__file__))
@@ -20,11 +24,15 @@ def main():
 
     if args.script == "proyecto":
         # Ejecutar Proyecto
+        from Proyecto import DataGenerator, ConfigLoader
+
         config_loader = ConfigLoader(config_path)
         data_generator = DataGenerator(config_loader)
         data_generator.run_proyecto(config_path, proyecto_path)
     elif args.script == "reporte":
         # Ejecutar Reporte
+        from Reporte import ReportGenerator
+
         ReportGenerator.run_reporte(config_path)
 
 
@@ -1,17 +1,57 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Tuple, Union
 import os
 import random
 import json
 from datetime import datetime
 import time
-import uuid
 import hashlib
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la libreria estandar
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(data: Dict[str, Union[str, int]]) -> bytes:
+    """
+    Serializa un registro como JSON indentado con dos espacios.
+
+    Ambas ramas producen exactamente los mismos bytes, con o sin orjson instalado.
+
+    Parameters:
+        data (Dict[str, Union[str, int]]): Datos a serializar.
+
+    Returns:
+        bytes: JSON codificado en UTF-8.
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Lee y analiza un archivo de configuración JSON, reutilizando el resultado mientras no cambie.
+
+    Parameters:
+        config_path (str): Ruta al archivo de configuración (config.json).
+        mtime_ns (int): Fecha de modificación del archivo en nanosegundos, parte de la llave de caché.
+        size (int): Tamaño del archivo en bytes, parte de la llave de caché.
+
+    Returns:
+        Dict: Configuración cargada.
+    """
+    with open(config_path, 'r') as config_file:
+        return json.load(config_file)
+
+
 class ConfigLoader:
     """
     Clase para cargar la configuración desde un archivo JSON.
@@ -20,11 +60,22 @@ class ConfigLoader:
         __output_path (str): Ruta predeterminada para la salida.
         __devices (List[str]): Lista de tipos de dispositivos.
         __missions (Dict[str, str]): Diccionario de misiones con sus abreviaturas.
+        __mission_keys (Tuple[str, ...]): Nombres de las misiones, calculados una sola vez.
         __statuses (List[str]): Lista de estados posibles para los dispositivos.
         __time_sleep (int): Tiempo de espera predeterminado.
         __num_files_range (List[int]): Rango para generar el número de archivos.
     """
 
+    __slots__ = (
+        '_ConfigLoader__output_path',
+        '_ConfigLoader__devices',
+        '_ConfigLoader__missions',
+        '_ConfigLoader__mission_keys',
+        '_ConfigLoader__statuses',
+        '_ConfigLoader__time_sleep',
+        '_ConfigLoader__num_files_range',
+    )
+
     def __init__(self, config_path: str) -> None:
         """
         Inicializa una instancia de ConfigLoader.
@@ -45,15 +96,17 @@ class ConfigLoader:
             None
         """
         try:
-            with open(config_path, 'r') as config_file:
-                config_data = json.load(config_file)
+            config_stat = os.stat(config_path)
+            config_data = _load_config_cached(config_path, config_stat.st_mtime_ns, config_stat.st_size)
 
+            # El diccionario en caché es compartido: cada instancia recibe sus propias copias de los contenedores
             self.__output_path: str = config_data.get('output_path', './devices')
-            self.__devices: List[str] = config_data.get('devices', [])
-            self.__missions: Dict[str, str] = config_data.get('missions', {})
-            self.__statuses: List[str] = config_data.get('statuses', ['excellent', 'good', 'warning', 'faulty', 'killed', 'unknown'])
+            self.__devices: List[str] = list(config_data.get('devices', []))
+            self.__missions: Dict[str, str] = dict(config_data.get('missions', {}))
+            self.__mission_keys: Tuple[str, ...] = tuple(self.__missions.keys())
+            self.__statuses: List[str] = list(config_data.get('statuses', ['excellent', 'good', 'warning', 'faulty', 'killed', 'unknown']))
             self.__time_sleep: int = config_data.get('time_sleep', 20)
-            self.__num_files_range: List[int] = config_data.get('num_files_range', [1, 100])
+            self.__num_files_range: List[int] = list(config_data.get('num_files_range', [1, 100]))
 
             logging.info("Configuración cargada correctamente.")
 
@@ -97,6 +150,16 @@ class ConfigLoader:
         """
         return self.__missions
 
+    @property
+    def mission_keys(self) -> Tuple[str, ...]:
+        """
+        Obtiene los nombres de las misiones.
+
+        Returns:
+            Tuple[str, ...]: Nombres de las misiones.
+        """
+        return self.__mission_keys
+
     @property
     def statuses(self) -> List[str]:
         """
@@ -187,7 +250,7 @@ class DataGenerator:
 
     def generate_hash(self, data: Dict[str, Union[str, int]]) -> str:
         """
-        Genera el hash SHA-256 de un diccionario convertido a cadena JSON.
+        Genera el hash SHA-256 de los campos de un registro, separados por '|'.
 
         Parameters:
             data (Dict[str, Union[str, int]]): Datos a ser hashados.
@@ -195,35 +258,79 @@ class DataGenerator:
         Returns:
             str: Hash SHA-256.
         """
-        hash_object = hashlib.sha256(json.dumps(data).encode())
+        hash_object = hashlib.sha256()
+        hash_object.update(str(data['date']).encode())
+        hash_object.update(b'|')
+        hash_object.update(str(data['mission']).encode())
+        hash_object.update(b'|')
+        hash_object.update(str(data['device_type']).encode())
+        hash_object.update(b'|')
+        hash_object.update(str(data['device_status']).encode())
         return hash_object.hexdigest()
 
-    def generate_file_data(self, mission: str, unique_id: str) -> Dict[str, Union[str, int]]:
+    def generate_file_data(self, mission: str, device: str, status: str, unique_id: str,
+                           date: str) -> Tuple[Dict[str, Union[str, int]], bool]:
         """
         Genera datos simulados para un archivo.
 
         Parameters:
             mission (str): Misión asociada a los datos.
+            device (str): Tipo de dispositivo.
+            status (str): Estado del dispositivo.
             unique_id (str): Identificador único para misiones desconocidas.
+            date (str): Fecha del registro en formato ISO 8601.
 
         Returns:
-            Dict[str, Union[str, int]]: Datos simulados para el archivo.
+            Tuple[Dict[str, Union[str, int]], bool]: Datos simulados para el archivo y si deben llevar hash.
         """
-        device = random.choice(self.__config_loader.devices)
         data: Dict[str, Union[str, int]] = {
-            "date": datetime.now().isoformat(),
+            "date": date,
             "mission": mission,
             "device_type": device,
-            "device_status": self.generate_random_status(),
+            "device_status": status,
             "hash": ""
         }
 
-        if mission == 'Unknown':
+        needs_hash = mission != 'Unknown'
+        if not needs_hash:
             data['mission'] = unique_id
             data['device_type'] = 'unknown'
             data['device_status'] = 'unknown'
 
-        return data
+        return data, needs_hash
+
+    def build_records(self, num_files: int, unique_id: str, date: str) -> List[Tuple[str, bytes]]:
+        """
+        Genera y serializa los registros de un lote de archivos.
+
+        Parameters:
+            num_files (int): Número de archivos del lote.
+            unique_id (str): Identificador único para misiones desconocidas.
+            date (str): Fecha de los registros en formato ISO 8601.
+
+        Returns:
+            List[Tuple[str, bytes]]: Nombre de cada archivo con su contenido JSON.
+        """
+        missions_map = self.__config_loader.missions
+        file_prefixes = {mission: f"APL{abbreviation}" for mission, abbreviation in missions_map.items()}
+
+        # Se sortea de una vez la misión, el dispositivo y el estado de todos los archivos del lote
+        chosen_missions = random.choices(self.__config_loader.mission_keys, k=num_files)
+        chosen_devices = random.choices(self.__config_loader.devices, k=num_files)
+        chosen_statuses = random.choices(self.__config_loader.statuses, k=num_files)
+
+        files_batch: List[Tuple[str, bytes]] = []
+        for i, (mission, device, status) in enumerate(zip(chosen_missions, chosen_devices, chosen_statuses), 1):
+            file_name = f"{file_prefixes[mission]}-{i:05d}.log"
+
+            data, needs_hash = self.generate_file_data(mission, device, status, unique_id, date)
+
+            if needs_hash:
+                data['hash'] = self.generate_hash(data)
+
+            files_batch.append((file_name, _dump_json(data)))
+
+        return files_batch
 
     def generate_files(self, iteration_count: int) -> None:
         """
@@ -236,60 +343,61 @@ class DataGenerator:
             None
         """
         try:
-            num_files = random.randint(self.__config_loader.num_files_range[0], self.__config_loader.num_files_range[1])
+            min_files, max_files = self.__config_loader.num_files_range
+            num_files = random.randint(min_files, max_files)
 
             folder_name = f"{iteration_count}_{num_files}"
             folder_path = os.path.join(self.__config_loader.output_path, folder_name)
             os.makedirs(folder_path, exist_ok=True)
 
-            unique_id = str(uuid.uuid4())
-
-            for i in range(1, num_files + 1):
-                mission = random.choice(list(self.__config_loader.missions.keys()))
+            unique_id = os.urandom(16).hex()
+            # Los archivos de una misma iteración comparten la fecha de generación
+            iteration_date = datetime.now().isoformat()
 
-                file_name = f"APL{self.__config_loader.missions[mission]}-0000{i}.log"
-                file_path = os.path.join(folder_path, file_name)
+            files_batch = self.build_records(num_files, unique_id, iteration_date)
 
-                data = self.generate_file_data(mission, unique_id)
-
-                if not file_name.startswith("APLUNKN"):
-                    data['hash'] = self.generate_hash(data)
-
-                with open(file_path, 'w') as file:
-                    json.dump(data, file, indent=4)
+            log_each_file = logger.isEnabledFor(logging.DEBUG)
+            for file_name, buffer in files_batch:
+                fd = os.open(os.path.join(folder_path, file_name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, buffer)
+                finally:
+                    os.close(fd)
 
-                logging.info(f"Archivo {file_name} generado en {folder_name} con éxito.")
+                if log_each_file:
+                    logger.debug("Archivo %s generado en %s con éxito.", file_name, folder_name)
 
-            time.sleep(self.__config_loader.time_sleep)
+            logger.info("Iteración %d: generados %d archivos en %s", iteration_count, num_files, folder_name)
 
         except OSError as e:
             logger.error(f"Error al crear directorio o archivo: {str(e)}")
         except Exception as e:
             logger.error(f"Error desconocido al generar archivos: {str(e)}")
 
-        # Se mueve la lógica de eliminación del directorio fuera del bloque try-except
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                try:
-                    with open(os.path.join(root, file), 'r'):
-                        pass
-                except Exception as e:
-                    logger.error(f"Error al cerrar el archivo: {str(e)}")
-
-        try:
-            os.removedirs(folder_path)
-        except OSError as e:
-            logger.error(f"Error al eliminar directorio: {str(e)}")
-
     @staticmethod
     def run_proyecto(config_path: str, proyecto_path: str) -> None:
         config_loader = ConfigLoader(config_path)
         data_generator = DataGenerator(config_loader)
 
+        # Cada lote se genera en segundo plano mientras corre la espera del periodo, y la
+        # espera se calcula contra un reloj monótono para que el periodo no acumule desfase.
         iteration_count = 0
-        while True:
-            iteration_count += 1
-            data_generator.generate_files(iteration_count)
+        next_run = time.monotonic()
+        pending: Optional[Future] = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                if pending is not None:
+                    pending.result()
+
+                iteration_count += 1
+                pending = executor.submit(data_generator.generate_files, iteration_count)
+
+                next_run += config_loader.time_sleep
+                delay = next_run - time.monotonic()
+                if delay < 0:
+                    next_run -= delay
+                    delay = 0
+                time.sleep(delay)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,41 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Tuple, Union
 import os
 import json
-import pandas as pd
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps  # Importa wraps del modulo functools
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional; se usa json de la libreria estandar
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+INOPERABLE_STATUSES = {'faulty', 'killed', 'unknown'}
+LOAD_DATA_WORKERS = 16
+
+
+def _read_json_file(file_path: str) -> Dict[str, Union[str, int]]:
+    """
+    Lee un archivo JSON pequeño con una sola llamada a os.read y lo analiza.
+
+    Parameters:
+        file_path (str): Ruta al archivo.
+
+    Returns:
+        Dict[str, Union[str, int]]: Datos del archivo.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        buffer = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return orjson.loads(buffer) if orjson else json.loads(buffer)
+
 
 def timing_decorator(func):
     @wraps(func)
@@ -22,6 +49,28 @@ def timing_decorator(func):
     return wrapper
 
 
+def _format_table(index_names: List[str], columns: List[str], rows: List[Tuple[Tuple[str, ...], List[str]]]) -> str:
+    """
+    Da formato de tabla de texto alineada a un conjunto de filas.
+
+    Parameters:
+        index_names (List[str]): Nombres de las columnas que identifican cada fila.
+        columns (List[str]): Nombres de las columnas de valores.
+        rows (List[Tuple[Tuple[str, ...], List[str]]]): Filas como (llave de la fila, valores).
+
+    Returns:
+        str: Tabla con una fila por linea.
+    """
+    table = [index_names + columns] + [list(key) + values for key, values in rows]
+    widths = [max(len(line[i]) for line in table) for i in range(len(table[0]))]
+    lines = []
+    for line in table:
+        cells = [cell.ljust(widths[i]) if i < len(index_names) else cell.rjust(widths[i])
+                 for i, cell in enumerate(line)]
+        lines.append("  ".join(cells).rstrip())
+    return "\n".join(lines)
+
+
 class ReportGenerator:
     """
     Clase para generar informes a partir de archivos generados.
@@ -53,8 +102,7 @@ class ReportGenerator:
             folder_path = os.path.join(self.devices_folder, folder_name)
             if os.path.isdir(folder_path):
                 data = self.load_data(folder_path)
-                df = pd.DataFrame(data)
-                self.generate_report(folder_name, df)
+                self.generate_report(folder_name, data)
 
     def load_data(self, folder_path: str) -> List[Dict[str, Union[str, int]]]:
         """
@@ -66,23 +114,33 @@ class ReportGenerator:
         Returns:
             List[Dict[str, Union[str, int]]]: Datos cargados desde los archivos.
         """
-        data = []
-        for root, _, files in os.walk(folder_path):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                with open(file_path, 'r') as file:
-                    file_data = json.load(file)
-                    data.append(file_data)
-        return data
+        file_paths = []
+        pending_folders = [folder_path]
+        while pending_folders:
+            # Igual que os.walk, se omiten las carpetas que no se pueden listar
+            try:
+                entries = os.scandir(pending_folders.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_folders.append(entry.path)
+                    elif entry.is_file():
+                        file_paths.append(entry.path)
+
+        # La lectura es dominada por llamadas al sistema, por lo que se solapa en hilos
+        with ThreadPoolExecutor(max_workers=LOAD_DATA_WORKERS) as executor:
+            return list(executor.map(_read_json_file, file_paths))
 
     @timing_decorator  # Aplica el decorador
-    def generate_report(self, folder_name: str, df: pd.DataFrame) -> None:
+    def generate_report(self, folder_name: str, data: List[Dict[str, Union[str, int]]]) -> None:
         """
         Genera un informe para un subdirectorio.
 
         Parameters:
             folder_name (str): Nombre del subdirectorio.
-            df (pd.DataFrame): DataFrame de datos.
+            data (List[Dict[str, Union[str, int]]]): Datos cargados desde los archivos.
 
         Returns:
             None
@@ -91,75 +149,103 @@ class ReportGenerator:
         report_path = os.path.join(self.reports_folder, report_filename)
 
         try:
+            # Un solo conteo sobre los datos alimenta todas las secciones del informe
+            grouped = Counter((str(d['mission']), str(d['device_type']), str(d['device_status'])) for d in data)
+            report_body = ''.join([
+                self.analyze_events(grouped),
+                self.detect_disconnections(grouped),
+                self.consolidate_missions(grouped),
+                self.calculate_percentages(grouped),
+            ])
+
             with open(report_path, 'w') as report_file:
-                report_file.write(self.analyze_events(df))
-                report_file.write(self.detect_disconnections(df))
-                report_file.write(self.consolidate_missions(df))
-                report_file.write(self.calculate_percentages(df))
+                report_file.write(report_body)
 
             logger.info(f"Reporte generado exitosamente en: {report_path}")
 
         except Exception as e:
             logger.error(f"Error al generar el reporte: {str(e)}")
 
-    def analyze_events(self, df: pd.DataFrame) -> str:
+    def analyze_events(self, grouped: Counter[Tuple[str, str, str]]) -> str:
         """
         Realiza un analisis de eventos y devuelve el resultado como una cadena.
 
         Parameters:
-            df (pd.DataFrame): DataFrame de datos.
+            grouped (Counter[Tuple[str, str, str]]): Conteo de registros por mision, tipo de dispositivo y estado.
 
         Returns:
             str: Resultado del analisis de eventos.
         """
         events_analysis = "\n\nb) Analisis de eventos\n"
-        events_analysis += df.groupby(['mission', 'device_type', 'device_status']).size().unstack().to_string()
+        statuses = sorted({status for _, _, status in grouped})
+        pairs = sorted({(mission, device) for mission, device, _ in grouped})
+        rows = [((mission, device), [str(grouped[(mission, device, status)]) for status in statuses])
+                for mission, device in pairs]
+        events_analysis += _format_table(['mission', 'device_type'], statuses, rows)
         return events_analysis
 
-    def detect_disconnections(self, df: pd.DataFrame) -> str:
+    def detect_disconnections(self, grouped: Counter[Tuple[str, str, str]]) -> str:
         """
         Identifica las desconexiones y devuelve el resultado como una cadena.
 
         Parameters:
-            df (pd.DataFrame): DataFrame de datos.
+            grouped (Counter[Tuple[str, str, str]]): Conteo de registros por mision, tipo de dispositivo y estado.
 
         Returns:
             str: Resultado de la identificacion de desconexiones.
         """
         disconnections_analysis = "\n\nc) Gestion de desconexiones\n"
-        unknown_disconnections = df[df['device_status'] == 'unknown'].groupby(['mission', 'device_type']).size().unstack()
-        disconnections_analysis += unknown_disconnections.to_string()
+        unknown_disconnections: Counter[Tuple[str, str]] = Counter()
+        for (mission, device, status), count in grouped.items():
+            if status == 'unknown':
+                unknown_disconnections[(mission, device)] += count
+        devices = sorted({device for _, device in unknown_disconnections})
+        missions = sorted({mission for mission, _ in unknown_disconnections})
+        rows = [((mission,), [str(unknown_disconnections[(mission, device)]) for device in devices])
+                for mission in missions]
+        disconnections_analysis += _format_table(['mission'], devices, rows)
         return disconnections_analysis
 
-    def consolidate_missions(self, df: pd.DataFrame) -> str:
+    def consolidate_missions(self, grouped: Counter[Tuple[str, str, str]]) -> str:
         """
         Consolida las misiones y devuelve el resultado como una cadena.
 
         Parameters:
-            df (pd.DataFrame): DataFrame de datos.
+            grouped (Counter[Tuple[str, str, str]]): Conteo de registros por mision, tipo de dispositivo y estado.
 
         Returns:
             str: Resultado de la consolidacion de misiones.
         """
         consolidation_analysis = "\n\nd) Consolidacion de misiones\n"
-        inoperable_devices = df[df['device_status'].isin(['faulty', 'killed', 'unknown'])].groupby(['mission']).size()
-        consolidation_analysis += inoperable_devices.to_string()
+        inoperable_devices: Counter[str] = Counter()
+        for (mission, _, status), count in grouped.items():
+            if status in INOPERABLE_STATUSES:
+                inoperable_devices[mission] += count
+        rows = [((mission,), [str(count)]) for mission, count in sorted(inoperable_devices.items())]
+        consolidation_analysis += _format_table(['mission'], ['inoperable'], rows)
         return consolidation_analysis
 
-    def calculate_percentages(self, df: pd.DataFrame) -> str:
+    def calculate_percentages(self, grouped: Counter[Tuple[str, str, str]]) -> str:
         """
         Calcula los porcentajes y devuelve el resultado como una cadena.
 
         Parameters:
-            df (pd.DataFrame): DataFrame de datos.
+            grouped (Counter[Tuple[str, str, str]]): Conteo de registros por mision, tipo de dispositivo y estado.
 
         Returns:
             str: Resultado del calculo de porcentajes.
         """
         percentages_analysis = "\n\ne) Calculo de porcentajes\n"
-        total_data = len(df)
-        device_mission_percentages = (df.groupby(['mission', 'device_type']).size() / total_data * 100).unstack()
-        percentages_analysis += device_mission_percentages.to_string()
+        total_data = sum(grouped.values())
+        device_mission_counts: Counter[Tuple[str, str]] = Counter()
+        for (mission, device, _), count in grouped.items():
+            device_mission_counts[(mission, device)] += count
+        devices = sorted({device for _, device in device_mission_counts})
+        missions = sorted({mission for mission, _ in device_mission_counts})
+        rows = [((mission,), [f"{device_mission_counts[(mission, device)] / total_data * 100:.2f}"
+                              for device in devices])
+                for mission in missions]
+        percentages_analysis += _format_table(['mission'], devices, rows)
         return percentages_analysis
 
     def move_devices_to_backup(self) -> None:
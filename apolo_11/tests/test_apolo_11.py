@@ -1,12 +1,13 @@
 import os
 import sys
+import tomllib
 from io import StringIO
 from unittest.mock import patch, Mock
 
 # Agrega el directorio principal del proyecto al sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "apolo_11")))
 
-from Apolo_11 import main
+from Apolo_11 import main, __version__
 
 def test_main_proyecto(monkeypatch):
     """
@@ -15,9 +16,9 @@ def test_main_proyecto(monkeypatch):
     with patch("argparse.ArgumentParser.parse_args", return_value=Mock(script="proyecto")) as mock_parse_args, \
          patch("builtins.open", side_effect=[StringIO('{"config_key": "config_value"}'), StringIO("some_data")]) as mock_open, \
          patch("os.path.exists", return_value=True) as mock_exists, \
-         patch("Apolo_11.ConfigLoader") as mock_config_loader, \
-         patch("Apolo_11.DataGenerator", autospec=True) as mock_data_generator, \
-         patch("Apolo_11.DataGenerator.run_proyecto") as mock_run_proyecto:
+         patch("Proyecto.ConfigLoader") as mock_config_loader, \
+         patch("Proyecto.DataGenerator", autospec=True) as mock_data_generator, \
+         patch("Proyecto.DataGenerator.run_proyecto") as mock_run_proyecto:
 
         monkeypatch.setattr(os.path, "join", lambda x, y: f"{x}/{y}")  # Simula la función os.path.join
         main()
@@ -27,3 +28,14 @@ def test_main_proyecto(monkeypatch):
     mock_config_loader.assert_called_once_with('{"config_key": "config_value"}')
     mock_data_generator.assert_called_once_with(mock_config_loader.return_value)
     mock_run_proyecto.assert_called_once_with('{"config_key": "config_value"}', 'path/to/Proyecto.py')
+
+
+def test_version_matches_pyproject():
+    """
+    Prueba que la version de Apolo_11.py coincide con la declarada en pyproject.toml.
+    """
+    pyproject_path = os.path.join(os.path.dirname(__file__), "..", "pyproject.toml")
+    with open(pyproject_path, "rb") as pyproject_file:
+        pyproject = tomllib.load(pyproject_file)
+
+    assert __version__ == pyproject["tool"]["poetry"]["version"]
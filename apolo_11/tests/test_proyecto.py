@@ -1,5 +1,8 @@
 import os
 import json
+import types
+import pytest
+from apolo_11 import Proyecto
 from apolo_11.Proyecto import ConfigLoader, DataGenerator
 import sys
 
@@ -32,6 +35,7 @@ def test_config_loader():
     assert config_loader.output_path == f"./{DEVICES_FOLDER_TEST}"
     assert config_loader.devices == ["dispositivo1", "dispositivo2"]
     assert config_loader.missions == {"mision1": "M1", "mision2": "M2"}
+    assert config_loader.mission_keys == ("mision1", "mision2")
     assert config_loader.statuses == ["estado1", "estado2"]
     assert config_loader.time_sleep == 10
     assert config_loader.num_files_range == [5, 10]
@@ -59,3 +63,165 @@ def test_data_generator():
 
     iteration_count = 1
     data_generator.generate_files(iteration_count)
+
+def test_build_records():
+    """
+    Test para DataGenerator.build_records.
+
+    Verifica que se genera un registro serializado por archivo, que las misiones conocidas llevan hash
+    y que las misiones desconocidas no.
+    """
+    config_data = {
+        "output_path": f"./{DEVICES_FOLDER_TEST}",
+        "devices": ["dispositivo1", "dispositivo2"],
+        "missions": {"mision1": "M1", "mision2": "M2", "Unknown": "UNKN"},
+        "statuses": ["estado1", "estado2"],
+        "time_sleep": 10,
+        "num_files_range": [5, 10]
+    }
+
+    with open(CONFIG_PATH, 'w') as config_file:
+        json.dump(config_data, config_file)
+
+    data_generator = DataGenerator(ConfigLoader(CONFIG_PATH))
+    records = data_generator.build_records(30, "id-unico", "2024-01-01T00:00:00")
+
+    assert len(records) == 30
+    for i, (file_name, buffer) in enumerate(records, 1):
+        data = json.loads(buffer)
+        assert file_name.startswith(("APLM1-", "APLM2-", "APLUNKN-"))
+        assert file_name.endswith(f"-{i:05d}.log")
+        assert data["date"] == "2024-01-01T00:00:00"
+        if file_name.startswith("APLUNKN-"):
+            assert data["mission"] == "id-unico"
+            assert data["hash"] == ""
+        else:
+            assert data["hash"] == data_generator.generate_hash(data)
+
+def test_generate_file_data_unknown_mission():
+    """
+    Test para DataGenerator.generate_file_data.
+
+    Verifica que una misión desconocida se marca como sin hash y con dispositivo y estado 'unknown'.
+    """
+    with open(CONFIG_PATH, 'w') as config_file:
+        json.dump({"devices": ["dispositivo1"], "missions": {"Unknown": "UNKN"}}, config_file)
+
+    data_generator = DataGenerator(ConfigLoader(CONFIG_PATH))
+
+    data, needs_hash = data_generator.generate_file_data("Unknown", "dispositivo1", "estado1", "id-unico", "fecha")
+    assert needs_hash is False
+    assert data["hash"] == ""
+    assert data["mission"] == "id-unico"
+    assert data["device_type"] == "unknown"
+    assert data["device_status"] == "unknown"
+
+    data, needs_hash = data_generator.generate_file_data("mision1", "dispositivo1", "estado1", "id-unico", "fecha")
+    assert needs_hash is True
+    assert data["mission"] == "mision1"
+    assert data["device_type"] == "dispositivo1"
+    assert data["device_status"] == "estado1"
+
+def test_run_proyecto_schedule(tmp_path, monkeypatch):
+    """
+    Test para el planificador de DataGenerator.run_proyecto.
+
+    Verifica con un reloj simulado que cada iteración genera su carpeta y que la espera se calcula
+    contra el plazo: tras una iteración que se pasa del periodo, el planificador se reinicia en lugar
+    de acumular atraso.
+    """
+    time_sleep = 20
+    overrun = 40
+    iterations = 4
+    config_path = tmp_path / "config.json"
+    output_path = tmp_path / "devices"
+    config_path.write_text(json.dumps({
+        "output_path": str(output_path),
+        "devices": ["dispositivo1"],
+        "missions": {"mision1": "M1"},
+        "statuses": ["estado1"],
+        "time_sleep": time_sleep,
+        "num_files_range": [3, 3]
+    }))
+
+    clock = [100.0]
+    delays = []
+
+    class StopScheduler(Exception):
+        pass
+
+    def fake_sleep(delay):
+        delays.append(delay)
+        clock[0] += delay
+        # La primera espera se alarga para simular una iteración que se pasa del periodo
+        if len(delays) == 1:
+            clock[0] += overrun
+        if len(delays) == iterations:
+            raise StopScheduler()
+
+    fake_time = types.SimpleNamespace(monotonic=lambda: clock[0], sleep=fake_sleep)
+    monkeypatch.setattr(Proyecto, "time", fake_time)
+
+    with pytest.raises(StopScheduler):
+        DataGenerator.run_proyecto(str(config_path), "")
+
+    assert sorted(os.listdir(output_path)) == [f"{i}_3" for i in range(1, iterations + 1)]
+    assert delays == [time_sleep, 0, time_sleep, time_sleep]
+    assert clock[0] == 100.0 + overrun + 3 * time_sleep
+
+def test_config_loader_reloads_modified_file():
+    """
+    Test para la caché de configuración de ConfigLoader.
+
+    Verifica que un cambio en el archivo de configuración se refleja en una nueva instancia.
+    """
+    config_data = {
+        "output_path": f"./{DEVICES_FOLDER_TEST}",
+        "devices": ["dispositivo1"],
+        "missions": {"mision1": "M1", "mision2": "M2"},
+        "statuses": ["estado1", "estado2"],
+        "time_sleep": 10,
+        "num_files_range": [5, 10]
+    }
+
+    with open(CONFIG_PATH, 'w') as config_file:
+        json.dump(config_data, config_file)
+
+    assert ConfigLoader(CONFIG_PATH).devices == ["dispositivo1"]
+
+    config_data["devices"] = ["dispositivo1", "dispositivo2"]
+    with open(CONFIG_PATH, 'w') as config_file:
+        json.dump(config_data, config_file)
+
+    assert ConfigLoader(CONFIG_PATH).devices == ["dispositivo1", "dispositivo2"]
+
+def test_config_loader_instances_do_not_share_containers():
+    """
+    Test para la caché de configuración de ConfigLoader.
+
+    Verifica que modificar los datos de una instancia no afecta a otra creada desde el mismo archivo.
+    """
+    config_data = {
+        "output_path": f"./{DEVICES_FOLDER_TEST}",
+        "devices": ["dispositivo1", "dispositivo2"],
+        "missions": {"mision1": "M1", "mision2": "M2"},
+        "statuses": ["estado1", "estado2"],
+        "time_sleep": 10,
+        "num_files_range": [5, 10]
+    }
+
+    with open(CONFIG_PATH, 'w') as config_file:
+        json.dump(config_data, config_file)
+
+    first_loader = ConfigLoader(CONFIG_PATH)
+    first_loader.devices.append("dispositivo3")
+    first_loader.missions["mision3"] = "M3"
+    first_loader.statuses.append("estado3")
+    first_loader.num_files_range.append(20)
+
+    second_loader = ConfigLoader(CONFIG_PATH)
+
+    assert second_loader.devices == ["dispositivo1", "dispositivo2"]
+    assert second_loader.missions == {"mision1": "M1", "mision2": "M2"}
+    assert second_loader.statuses == ["estado1", "estado2"]
+    assert second_loader.num_files_range == [5, 10]
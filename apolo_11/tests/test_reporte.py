@@ -1,6 +1,6 @@
 import os
 import pytest
-import pandas as pd
+from collections import Counter
 from apolo_11.Reporte import ReportGenerator
 
 # Rutas para las pruebas
@@ -18,17 +18,21 @@ def test_load_data(report_generator):
     data = report_generator.load_data(DEVICES_FOLDER_TEST)
     assert isinstance(data, list)
 
+# Prueba para asegurarse de que una carpeta inexistente no produce datos ni errores
+def test_load_data_missing_folder(report_generator):
+    data = report_generator.load_data(os.path.join(DEVICES_FOLDER_TEST, "carpeta_inexistente"))
+    assert data == []
+
 # Prueba para verificar que se pueda generar un informe sin errores
 def test_generate_report(report_generator):
     # Crear algunos datos de prueba en DEVICES_FOLDER_TEST antes de ejecutar esta prueba
     data = report_generator.load_data(DEVICES_FOLDER_TEST)
-    df = pd.DataFrame(data)
-    
+
     # Asegúrate de que la carpeta de informes de prueba exista
     os.makedirs(REPORTS_FOLDER_TEST, exist_ok=True)
 
     # Ejecutar la prueba
-    report_generator.generate_report("test", df)
+    report_generator.generate_report("test", data)
 
     # Obtener la lista de archivos en la carpeta de informes de prueba
     generated_reports = os.listdir(REPORTS_FOLDER_TEST)
@@ -37,6 +41,72 @@ def test_generate_report(report_generator):
     # Asegurarse de que se haya generado un informe en la carpeta de informes de prueba
     assert any(f.startswith("APLSTATS-REPORT[test]") for f in generated_reports)
 
+# Prueba para verificar que la consolidacion solo cuenta dispositivos inoperables
+def test_consolidate_missions(report_generator):
+    grouped = Counter({
+        ("OrbitOne", "Naves", "faulty"): 2,
+        ("OrbitOne", "Trajes", "good"): 3,
+        ("VacMars", "Naves", "unknown"): 1,
+        ("VacMars", "Naves", "killed"): 4,
+    })
+
+    lines = report_generator.consolidate_missions(grouped).strip().splitlines()
+
+    assert lines[-2].split() == ["OrbitOne", "2"]
+    assert lines[-1].split() == ["VacMars", "5"]
+
+# Prueba para verificar que los eventos ausentes se muestran como 0
+def test_analyze_events(report_generator):
+    grouped = Counter({
+        ("OrbitOne", "Naves", "good"): 2,
+        ("VacMars", "Trajes", "faulty"): 1,
+    })
+
+    lines = report_generator.analyze_events(grouped).strip().splitlines()
+
+    assert lines[1].split() == ["mission", "device_type", "faulty", "good"]
+    assert lines[2].split() == ["OrbitOne", "Naves", "0", "2"]
+    assert lines[3].split() == ["VacMars", "Trajes", "1", "0"]
+
+# Prueba para verificar que solo se cuentan los dispositivos con estado 'unknown'
+def test_detect_disconnections(report_generator):
+    grouped = Counter({
+        ("OrbitOne", "Naves", "unknown"): 2,
+        ("OrbitOne", "Naves", "good"): 5,
+        ("VacMars", "Trajes", "unknown"): 1,
+        ("VacMars", "Naves", "killed"): 3,
+    })
+
+    lines = report_generator.detect_disconnections(grouped).strip().splitlines()
+
+    assert lines[1].split() == ["mission", "Naves", "Trajes"]
+    assert lines[2].split() == ["OrbitOne", "2", "0"]
+    assert lines[3].split() == ["VacMars", "0", "1"]
+    assert len(lines) == 4
+
+# Prueba para verificar que sin desconexiones solo se muestra el encabezado
+def test_detect_disconnections_without_unknown(report_generator):
+    grouped = Counter({("OrbitOne", "Naves", "good"): 2})
+
+    lines = report_generator.detect_disconnections(grouped).strip().splitlines()
+
+    assert lines[-1].split() == ["mission"]
+    assert lines[-2] == "c) Gestion de desconexiones"
+
+# Prueba para verificar que los porcentajes se calculan sobre el total con dos decimales
+def test_calculate_percentages(report_generator):
+    grouped = Counter({
+        ("OrbitOne", "Naves", "good"): 1,
+        ("OrbitOne", "Naves", "faulty"): 1,
+        ("VacMars", "Trajes", "good"): 1,
+    })
+
+    lines = report_generator.calculate_percentages(grouped).strip().splitlines()
+
+    assert lines[1].split() == ["mission", "Naves", "Trajes"]
+    assert lines[2].split() == ["OrbitOne", "66.67", "0.00"]
+    assert lines[3].split() == ["VacMars", "0.00", "33.33"]
+
 # Prueba para verificar que se puedan mover los dispositivos a la carpeta de respaldo
 def test_move_devices_to_backup(report_generator):
     # Crear algunos datos de prueba en DEVICES_FOLDER_TEST antes de ejecutar esta prueba